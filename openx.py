@@ -10,14 +10,17 @@ import sys
 import traceback
 import re
 import signal
+import time
 from colorama import Fore, Style, init
 from scanner.core import Scanner
-from scanner.utils import validate_url, load_urls_from_file
+from scanner.utils import validate_url, load_urls_from_file, format_duration
 from output.formatters import OutputFormatter
 from scanner.external import ExternalTools
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+# Initialize colorama for cross-platform colored output; strip the ANSI
+# codes entirely when stdout is piped (one isatty check here instead of
+# per-write filtering in colorama's stream wrapper)
+init(autoreset=True, strip=not sys.stdout.isatty())
 
 # Global scanner instance for signal handling
 scanner_instance = None
@@ -29,14 +32,13 @@ def signal_handler(signum, frame):
     print(f"\n{Fore.RED}[!] Scan interrupted by user - shutting down immediately{Style.RESET_ALL}")
     sys.exit(0)
 
-def print_banner():
-    """Print OpenX banner"""
-    banner = f"""
+# Rendered once at import time; print_banner only has to print it
+_BANNER = f"""
 {Fore.CYAN}
  ██████╗ ██████╗ ███████╗███╗   ██╗██╗  ██╗
 ██╔═══██╗██╔══██╗██╔════╝████╗  ██║╚██╗██╔╝
-██║   ██║██████╔╝█████╗  ██╔██╗ ██║ ╚███╔╝ 
-██║   ██║██╔═══╝ ██╔══╝  ██║╚██╗██║ ██╔██╗ 
+██║   ██║██████╔╝█████╗  ██╔██╗ ██║ ╚███╔╝
+██║   ██║██╔═══╝ ██╔══╝  ██║╚██╗██║ ██╔██╗
 ╚██████╔╝██║     ███████╗██║ ╚████║██╔╝ ██╗
  ╚═════╝ ╚═╝     ╚══════╝╚═╝  ╚═══╝╚═╝  ╚═╝
 {Style.RESET_ALL}
@@ -44,7 +46,10 @@ def print_banner():
 {Fore.GREEN}Author: Karthik S Sathyan{Style.RESET_ALL}
 {Fore.BLUE}https://github.com/Karthikdude/openx{Style.RESET_ALL}
 """
-    print(banner)
+
+def print_banner():
+    """Print OpenX banner"""
+    print(_BANNER)
 
 def create_parser():
     """Create and configure argument parser"""
@@ -247,7 +252,6 @@ def main():
         elif args.stdin:
             # Read URLs from STDIN explicitly
             try:
-                import sys
                 urls = []
                 for line in sys.stdin:
                     line = line.strip()
@@ -271,8 +275,6 @@ def main():
         
         else:
             # Check if data is being piped (auto-detect STDIN)
-            import sys
-            
             if not sys.stdin.isatty():
                 # Data is being piped, read from STDIN
                 try:
@@ -302,8 +304,10 @@ def main():
         if not args.silent:
             print(f"{Fore.CYAN}[INFO] Starting scan of {len(urls)} URL(s)...{Style.RESET_ALL}")
         
+        scan_start = time.time()
         results = scanner.scan_urls(urls)
-        
+        scan_duration = time.time() - scan_start
+
         # Output results
         formatter = OutputFormatter(
             output_file=args.output,
@@ -322,6 +326,7 @@ def main():
             print(f"URLs tested: {len(results)}")
             print(f"Vulnerable URLs: {vulnerable_urls}")
             print(f"Total vulnerabilities: {total_vulnerabilities}")
+            print(f"Scan duration: {format_duration(scan_duration)}")
             
             if total_vulnerabilities > 0:
                 print(f"{Fore.GREEN}[SUCCESS] Found {total_vulnerabilities} vulnerabilities!{Style.RESET_ALL}")
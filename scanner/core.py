@@ -8,14 +8,196 @@ import re
 import time
 import threading
 import urllib3
+from collections import Counter, OrderedDict
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from colorama import Fore, Style
 from .payloads import PayloadManager
-from .utils import is_external_redirect, extract_redirect_url, parse_response_for_redirects, get_domain_from_url, verify_evil_com_redirect
+from .utils import is_external_redirect, extract_redirect_url, parse_response_for_redirects, get_domain_from_url, verify_evil_com_redirect, install_dns_cache
+
+# Case-insensitive match for the canonical test domain; a compiled regex
+# search avoids allocating a lowercased copy of every candidate URL
+_EVIL_COM_RE = re.compile(r'evil\.com', re.IGNORECASE)
+
+# HTTP status codes that indicate a redirect response
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+
+# Cap on how much of a response body is downloaded; JS/meta redirect
+# markers live near the top of the document, so multi-MB pages don't
+# need to be pulled in full
+_MAX_BODY_BYTES = 262144
+
+# Headers to test (expanded for real-world scenarios including 2025
+# findings); built once at import time instead of per call
+_HEADER_INJECTION_NAMES = (
+    'X-Redirect-To',
+    'X-Forward-To',
+    'X-Forwarded-Host',     # Critical: Used in dashboard.omise.co attack
+    'X-Forwarded-For',
+    'X-Real-IP',
+    'Location',
+    'Referer',
+    'Origin',
+    'Host',
+    'X-Original-Host',
+    'X-Host',
+    'Forwarded',
+    'Via',
+    'X-Forwarded-Proto',
+    'X-Forwarded-Port',
+    'X-Custom-Redirect',
+    'X-Return-To',
+    'X-Continue-To',
+    # Additional headers from 2025 research
+    'X-Forwarded-URI',
+    'X-Original-URI',
+    'X-Rewrite-URL',
+    'CF-Connecting-IP',     # Cloudflare specific
+    'True-Client-IP',       # Akamai specific
+    'X-Cluster-Client-IP',  # AWS ALB specific
+    'X-Forwarded-Server',
+    'X-ProxyUser-Ip',
+)
+
+# Indicator lists for the advanced real-world scenario classification,
+# shared across every URL instead of rebuilt per classification
+_CHAIN_PARAMS = ('first', 'second', 'third', 'chain', 'hop', 'intermediate')
+_OAUTH_INDICATORS = ('oauth', 'authorize', 'redirect_uri', 'client_id', 'response_type')
+_OAUTH_PARAMS = ('redirect_uri', 'callback_url', 'return_url', 'state')
+_ENTERPRISE_INDICATORS = (
+    'grafana', 'jenkins', 'gitlab', 'github', 'jira', 'confluence',
+    'admin', 'dashboard', 'login', 'sso', 'saml', 'ldap',
+    'payment', 'checkout', 'success', 'confirm', 'verify'
+)
+_ENTERPRISE_PARAMS = (
+    'returnTo', 'return_to', 'success_url', 'cancel_url',
+    'confirm_url', 'verify_url', 'next_page', 'continue_to'
+)
+
+def _inject_query_param(url, param_name, payload):
+    """Build a test URL with param_name set to payload
+
+    Replaces any existing occurrence of the parameter while leaving the
+    rest of the query string untouched, avoiding the decode/re-encode
+    round-trip of parse_qs/urlencode/urlunparse for every probe.
+    """
+    base, hash_sep, fragment = url.partition('#')
+    path_part, _, query = base.partition('?')
+    encoded = f"{param_name}={urllib.parse.quote_plus(payload)}"
+
+    if param_name not in query:
+        # Pure append — the common case when injecting a speculative
+        # parameter — needs no split/rebuild of the existing query
+        test_url = f"{path_part}?{query}&{encoded}" if query else f"{path_part}?{encoded}"
+    else:
+        pairs = [pair for pair in query.split('&')
+                 if pair and pair.split('=', 1)[0] != param_name]
+        pairs.append(encoded)
+        test_url = f"{path_part}?{'&'.join(pairs)}"
+    if hash_sep:
+        test_url += '#' + fragment
+    return test_url
+
+@lru_cache(maxsize=1024)
+def _payload_domain(payload):
+    """Extract the normalized target domain from a payload, if it has one
+
+    The payload list is fixed for the lifetime of a scan while this is
+    consulted for every vulnerable-looking response, so each distinct
+    payload is parsed exactly once per run.
+    """
+    if payload.startswith(('http://', 'https://')):
+        try:
+            parsed = urllib.parse.urlsplit(payload)
+            return parsed.netloc.lower().split(':')[0].replace('www.', '')
+        except ValueError:
+            return None
+    if payload.startswith('//'):
+        try:
+            parsed = urllib.parse.urlsplit('http:' + payload)
+            return parsed.netloc.lower().split(':')[0].replace('www.', '')
+        except ValueError:
+            return None
+    if '.' in payload and not payload.startswith('./'):
+        # Assume it's a domain
+        return payload.lower().split(':')[0].replace('www.', '')
+    return None
+
+@lru_cache(maxsize=2048)
+def _is_legitimate_external_redirect(original_url, redirect_url, payload):
+    """Pure string-only check behind Scanner.is_legitimate_external_redirect
+
+    Memoized: the same (original, location, payload) triple recurs when
+    one payload redirects identically across many parameters, and each
+    evaluation re-parses up to three URLs.
+    """
+    # Relative locations (the common case for internal redirects) can
+    # never leave the origin — bail out before any URL parsing. A
+    # leading '//' is protocol-relative and still needs the full check.
+    if not redirect_url:
+        return False
+    first = redirect_url[0]
+    if first in '?#' or (first == '/' and not redirect_url.startswith('//')):
+        return False
+
+    # First check if it's actually an external redirect
+    if not is_external_redirect(original_url, redirect_url):
+        return False
+
+    # Get domains through the memoized helper (already lowercased),
+    # then strip port numbers and the www. prefix for comparison
+    original_domain = (get_domain_from_url(original_url) or '').split(':')[0].replace('www.', '')
+    redirect_domain = (get_domain_from_url(redirect_url) or '').split(':')[0].replace('www.', '')
+    
+    # If domains are the same, it's not an external redirect
+    if original_domain == redirect_domain:
+        return False
+    
+    # Check if the payload is actually causing the redirect
+    # The payload should be present in the redirect URL or should be the target domain
+    payload_lower = payload.lower()
+    redirect_url_lower = redirect_url.lower()
+    
+    # Extract domain from payload if it's a URL (memoized per payload)
+    payload_domain = _payload_domain(payload)
+    
+    # Check if the redirect is actually to our payload domain
+    if payload_domain:
+        if payload_domain == redirect_domain:
+            return True
+        # Also check if payload domain is in the redirect URL
+        if payload_domain in redirect_url_lower:
+            return True
+    
+    # Check if the payload is reflected in the redirect URL
+    if payload_lower in redirect_url_lower:
+        return True
+    
+    # Additional check: if the redirect URL contains our test domain
+    if 'evil.com' in redirect_url_lower and 'evil.com' in payload_lower:
+        return True
+    
+    # If none of the above conditions are met, it's likely a false positive
+    return False
+
 
 class Scanner:
     """Main scanner class for open redirect vulnerability detection"""
-    
+
+    # Scanner attributes are read thousands of times per URL from the
+    # worker threads; __slots__ skips the per-instance __dict__ on every
+    # lookup and keeps instances compact
+    __slots__ = (
+        'threads', 'timeout', 'delay', 'user_agent', 'proxy',
+        'follow_redirects', 'verbose', 'silent', 'fast_mode', 'small_mode',
+        'test_headers', 'callback_url', 'show_status_codes', 'verify_ssl',
+        'hide_errors', 'reduce_false_positives', 'ignore_same_domain',
+        'ignore_wp_oembed', 'ignore_queue_systems', 'verify_evil_com',
+        'output_lock', 'request_gate', '_shutdown', '_executor', '_param_pool',
+        '_payload_score', '_probed', '_probed_lock', '_probed_max',
+        'payload_manager', 'session', '_request_kwargs',
+    )
+
     def __init__(self, threads=10, timeout=10, delay=0, user_agent=None, 
                  proxy=None, follow_redirects=5, verbose=False, silent=False,
                  fast_mode=False, small_mode=False, test_headers=False,
@@ -35,7 +217,9 @@ class Scanner:
             hide_errors (bool): Hide error messages from terminal output. Defaults to False.
         """
         self.threads = threads
-        self.timeout = timeout
+        # Split connect/read timeouts so probes against dead hosts fail
+        # after the connect attempt instead of eating the full read budget
+        self.timeout = (min(3.05, timeout), timeout)
         self.delay = delay
         self.user_agent = user_agent or 'OpenX/1.0 (Security Scanner)'
         self.proxy = {'http': proxy, 'https': proxy} if proxy else None
@@ -59,9 +243,34 @@ class Scanner:
         
         # Thread lock for output synchronization
         self.output_lock = threading.Lock()
+
+        # Bound the number of in-flight HTTP requests to the configured
+        # thread count, regardless of how callers fan out
+        self.request_gate = threading.BoundedSemaphore(max(1, threads))
         
         # Shutdown flag for immediate termination
         self._shutdown = False
+
+        # Single long-lived thread pool, created lazily on first scan
+        self._executor = None
+
+        # Long-lived inner pool shared by every scan_single_url call for
+        # parallel parameter bursts; ThreadPoolExecutor only spawns its
+        # workers on demand, so serial scans never pay for it
+        self._param_pool = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+
+        # Per-payload vulnerability hit counts; used to try the most
+        # productive payloads first, which lets fast mode bail out
+        # sooner. Updated without a lock — a lost increment under
+        # contention only skews a heuristic.
+        self._payload_score = Counter()
+
+        # LRU-bounded set of already-probed (endpoint, param, payload)
+        # combinations; crawled URL lists repeat the same endpoint with
+        # minor query variations, and re-probing them is wasted I/O
+        self._probed = OrderedDict()
+        self._probed_lock = threading.Lock()
+        self._probed_max = 65536
         
         # Initialize payload manager
         self.payload_manager = PayloadManager(
@@ -69,15 +278,43 @@ class Scanner:
             custom_payloads_file=custom_payloads,
             small_mode=small_mode
         )
-        
-        # Session configuration
+
+        # Normalize every payload's target domain up front; the scan
+        # loops then always hit the warm cache instead of paying the
+        # first parse mid-probe
+        for payload in self.payload_manager.get_payloads():
+            _payload_domain(payload)
+        
+        # Session configuration; size the keep-alive pool to the worker
+        # count so every thread can hold a pooled connection, and leave
+        # retries to the caller (a failed probe is just a miss)
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=max(10, threads),
+            pool_maxsize=max(10, threads * 2),
+            max_retries=0
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Cap chain-analysis follow-ups at the configured hop budget
+        # instead of the library default of 30
+        self.session.max_redirects = max(1, follow_redirects)
         self.session.headers.update({'User-Agent': self.user_agent})
         if self.proxy:
             self.session.proxies.update(self.proxy)
         
         # Configure session to handle Unicode properly
         self.session.encoding = 'utf-8'
+
+        # Static per-request settings, assembled once instead of per call
+        self._request_kwargs = {
+            'timeout': self.timeout,
+            'verify': self.verify_ssl,
+        }
+
+        # Cache DNS lookups so repeated probes against the same host
+        # don't pay a resolver round-trip each time
+        install_dns_cache()
         
         # Suppress only the InsecureRequestWarning if verify_ssl is False
         if not self.verify_ssl:
@@ -105,23 +342,41 @@ class Scanner:
     def shutdown(self):
         """Shutdown the scanner immediately"""
         self._shutdown = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._param_pool is not None:
+            self._param_pool.shutdown(wait=False)
+            self._param_pool = None
     
     def make_request(self, url, method='GET', headers=None, allow_redirects=True):
         """Make HTTP request with error handling"""
         try:
-            extra_headers = headers or {}
             # Ensure URL is properly encoded
             if isinstance(url, str):
                 url = url.encode('utf-8', errors='ignore').decode('utf-8')
-            
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=extra_headers,
-                timeout=self.timeout,
-                allow_redirects=allow_redirects,
-                verify=self.verify_ssl
-            )
+
+            with self.request_gate:
+                # Passing headers=None lets the session reuse its own
+                # header set instead of merging an empty dict per call
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=headers or None,
+                    allow_redirects=allow_redirects,
+                    stream=True,
+                    **self._request_kwargs
+                )
+
+            # Read at most _MAX_BODY_BYTES so response.text/content work
+            # downstream without downloading oversized bodies
+            try:
+                response._content = response.raw.read(_MAX_BODY_BYTES, decode_content=True)
+            except Exception:
+                response._content = b''
+            finally:
+                response.close()
+
             return response
         except UnicodeEncodeError as e:
             self.log(f"Unicode encoding error for {url}: {str(e)}", 'ERROR')
@@ -130,141 +385,127 @@ class Scanner:
             self.log(f"Request failed for {url}: {str(e)}", 'ERROR')
             return None
     
+    def verify_redirect_target(self, location, context):
+        """Verify an evil.com redirect target if verification is enabled
+
+        Returns a tuple (verified, report) where report indicates whether
+        the finding should be recorded as a vulnerability.
+        """
+        is_evil_com = _EVIL_COM_RE.search(location) is not None
+        verified = True  # Default to true for non-evil.com redirects
+
+        if is_evil_com and self.verify_evil_com:
+            self.log(f"Verifying evil.com {context}: {location}", 'VERBOSE', Fore.YELLOW)
+            verified = verify_evil_com_redirect(location)
+            if not verified:
+                self.log(f"Failed to verify evil.com {context}: {location}", 'VERBOSE', Fore.RED)
+
+        return verified, (verified or not self.verify_evil_com)
+
+    def build_vulnerability(self, url, parameter, payload, method, status_code,
+                            location, severity, description, verified):
+        """Build a vulnerability result dict with the standard fields"""
+        return {
+            'url': url,
+            'parameter': parameter,
+            'payload': payload,
+            'method': method,
+            'status_code': status_code,
+            'location_header': location,
+            'severity': severity,
+            'description': description,
+            'verified': verified
+        }
+
     def is_legitimate_external_redirect(self, original_url, redirect_url, payload):
         """Check if a redirect is a legitimate external redirect caused by our payload"""
-        # First check if it's actually an external redirect
-        if not is_external_redirect(original_url, redirect_url):
-            return False
-        
-        # Parse both URLs
-        original_parsed = urllib.parse.urlparse(original_url)
-        redirect_parsed = urllib.parse.urlparse(redirect_url)
-        
-        # Get domains
-        original_domain = original_parsed.netloc.lower()
-        redirect_domain = redirect_parsed.netloc.lower()
-        
-        # Remove port numbers for comparison
-        original_domain = original_domain.split(':')[0]
-        redirect_domain = redirect_domain.split(':')[0]
-        
-        # Remove www. prefix for comparison
-        original_domain = original_domain.replace('www.', '')
-        redirect_domain = redirect_domain.replace('www.', '')
-        
-        # If domains are the same, it's not an external redirect
-        if original_domain == redirect_domain:
+        return _is_legitimate_external_redirect(original_url, redirect_url, payload)
+
+    def record_finding(self, vulnerabilities, context, test_url, parameter,
+                       payload, method, status_code, location, severity,
+                       description, label):
+        """Verify a redirect target and record it if reportable
+
+        Single home for the verify/build/log sequence that the param,
+        chain, JS/meta and header detection paths all ran inline.
+        """
+        verified, report = self.verify_redirect_target(location, context)
+        if not report:
             return False
-        
-        # Check if the payload is actually causing the redirect
-        # The payload should be present in the redirect URL or should be the target domain
-        payload_lower = payload.lower()
-        redirect_url_lower = redirect_url.lower()
-        
-        # Extract domain from payload if it's a URL
-        payload_domain = None
-        if payload.startswith(('http://', 'https://')):
-            try:
-                payload_parsed = urllib.parse.urlparse(payload)
-                payload_domain = payload_parsed.netloc.lower().split(':')[0].replace('www.', '')
-            except:
-                pass
-        elif payload.startswith('//'):
-            try:
-                payload_parsed = urllib.parse.urlparse('http:' + payload)
-                payload_domain = payload_parsed.netloc.lower().split(':')[0].replace('www.', '')
-            except:
-                pass
-        elif '.' in payload and not payload.startswith('./'):
-            # Assume it's a domain
-            payload_domain = payload.lower().split(':')[0].replace('www.', '')
-        
-        # Check if the redirect is actually to our payload domain
-        if payload_domain:
-            if payload_domain == redirect_domain:
-                return True
-            # Also check if payload domain is in the redirect URL
-            if payload_domain in redirect_url_lower:
-                return True
-        
-        # Check if the payload is reflected in the redirect URL
-        if payload_lower in redirect_url_lower:
-            return True
-        
-        # Additional check: if the redirect URL contains our test domains
-        test_domains = ['evil.com']
-        for test_domain in test_domains:
-            if test_domain in redirect_url_lower and test_domain in payload_lower:
+        vulnerabilities.append(self.build_vulnerability(
+            test_url, parameter, payload, method, status_code,
+            location, severity, description, verified
+        ))
+        verification_status = "(verified)" if verified else "(unverified)"
+        self.log(f"Found {label}: {test_url} -> {location} {verification_status}", 'VULN')
+        return True
+
+    def already_probed(self, key):
+        """Record a probe key, returning True when it was already seen"""
+        with self._probed_lock:
+            if key in self._probed:
+                self._probed.move_to_end(key)
                 return True
-        
-        # If none of the above conditions are met, it's likely a false positive
+            self._probed[key] = None
+            if len(self._probed) > self._probed_max:
+                self._probed.popitem(last=False)
         return False
-    
+
+    def forget_probed(self, key):
+        """Drop a probe key recorded by already_probed
+
+        Called when the probe's request never got a response, so a
+        transient timeout doesn't permanently suppress that probe for
+        every later URL sharing the endpoint.
+        """
+        with self._probed_lock:
+            self._probed.pop(key, None)
+
     def test_url_parameter(self, base_url, param_name, payload):
         """Test a specific URL parameter with a payload"""
         vulnerabilities = []
-        
-        # Parse URL and add/modify parameter
-        parsed_url = urllib.parse.urlparse(base_url)
-        query_params = urllib.parse.parse_qs(parsed_url.query)
-        query_params[param_name] = [payload]
-        
-        # Reconstruct URL with payload
-        new_query = urllib.parse.urlencode(query_params, doseq=True)
-        test_url = urllib.parse.urlunparse((
-            parsed_url.scheme,
-            parsed_url.netloc,
-            parsed_url.path,
-            parsed_url.params,
-            new_query,
-            parsed_url.fragment
-        ))
-        
-        self.log(f"Testing: {test_url}", 'VERBOSE', Fore.BLUE)
+
+        # Skip exact (endpoint, param, payload) repeats; the path is kept
+        # in the key because different endpoints on one host can redirect
+        # differently
+        probe_key = (base_url.partition('?')[0], param_name, payload)
+        if self.already_probed(probe_key):
+            return vulnerabilities
+
+        # Build test URL with the payload injected into the query string
+        test_url = _inject_query_param(base_url, param_name, payload)
+
+        # Guarded so the f-string isn't built on every probe when
+        # verbose output is off
+        if self.verbose:
+            self.log(f"Testing: {test_url}", 'VERBOSE', Fore.BLUE)
         
         # Test without following redirects first
         response = self.make_request(test_url, allow_redirects=False)
         if not response:
+            self.forget_probed(probe_key)
             return vulnerabilities
         
         # Check for redirect response
-        if response.status_code in [301, 302, 303, 307, 308]:
+        if response.status_code in _REDIRECT_CODES:
             location = response.headers.get('Location', '')
             if location:
                 # Check if this is actually an external redirect caused by our payload
                 if self.is_legitimate_external_redirect(base_url, location, payload):
-                    # Check if it's an evil.com redirect and needs verification
-                    is_evil_com = 'evil.com' in location.lower()
-                    verified = True  # Default to true for non-evil.com redirects
-                    
-                    # Verify evil.com redirects if enabled
-                    if is_evil_com and self.verify_evil_com:
-                        self.log(f"Verifying evil.com redirect: {location}", 'VERBOSE', Fore.YELLOW)
-                        verified = verify_evil_com_redirect(location)
-                        if not verified:
-                            self.log(f"Failed to verify evil.com redirect: {location}", 'VERBOSE', Fore.RED)
-                    
-                    # Only report as vulnerability if verified or verification is disabled
-                    if verified or not self.verify_evil_com:
-                        vulnerability = {
-                            'url': test_url,
-                            'parameter': param_name,
-                            'payload': payload,
-                            'method': 'URL Parameter',
-                            'status_code': response.status_code,
-                            'location_header': location,
-                            'severity': 'High',
-                            'description': f'Open redirect via {param_name} parameter',
-                            'verified': verified
-                        }
-                        vulnerabilities.append(vulnerability)
-                        verification_status = "(verified)" if verified else "(unverified)"
-                        self.log(f"Found vulnerability: {test_url} -> {location} {verification_status}", 'VULN')
+                    self.record_finding(
+                        vulnerabilities, 'redirect', test_url, param_name,
+                        payload, 'URL Parameter', response.status_code,
+                        location, 'High',
+                        f'Open redirect via {param_name} parameter',
+                        'vulnerability'
+                    )
                 else:
                     self.log(f"Filtered false positive: {test_url} -> {location} (not a legitimate external redirect)", 'VERBOSE', Fore.YELLOW)
         
-        # Test with redirect following for deeper analysis
-        if self.follow_redirects > 0:
+        # Test with redirect following for deeper analysis; the second
+        # request is only worth issuing when the first response actually
+        # redirected, otherwise there is no chain to resolve
+        if self.follow_redirects > 0 and response.status_code in _REDIRECT_CODES:
             response_full = self.make_request(test_url, allow_redirects=True)
             if response_full and response_full.url != test_url:
                 final_url = response_full.url
@@ -272,33 +513,13 @@ class Scanner:
                     # Check if this is a new vulnerability or already found
                     existing = any(v['location_header'] == final_url for v in vulnerabilities)
                     if not existing:
-                        # Check if it's an evil.com redirect and needs verification
-                        is_evil_com = 'evil.com' in final_url.lower()
-                        verified = True  # Default to true for non-evil.com redirects
-                        
-                        # Verify evil.com redirects if enabled
-                        if is_evil_com and self.verify_evil_com:
-                            self.log(f"Verifying evil.com redirect chain: {final_url}", 'VERBOSE', Fore.YELLOW)
-                            verified = verify_evil_com_redirect(final_url)
-                            if not verified:
-                                self.log(f"Failed to verify evil.com redirect chain: {final_url}", 'VERBOSE', Fore.RED)
-                        
-                        # Only report as vulnerability if verified or verification is disabled
-                        if verified or not self.verify_evil_com:
-                            vulnerability = {
-                                'url': test_url,
-                                'parameter': param_name,
-                                'payload': payload,
-                                'method': 'URL Parameter (Redirect Chain)',
-                                'status_code': response_full.status_code,
-                                'location_header': final_url,
-                                'severity': 'High',
-                                'description': f'Open redirect via {param_name} parameter (redirect chain)',
-                                'verified': verified
-                            }
-                            vulnerabilities.append(vulnerability)
-                            verification_status = "(verified)" if verified else "(unverified)"
-                            self.log(f"Found redirect chain vulnerability: {test_url} -> {final_url} {verification_status}", 'VULN')
+                        self.record_finding(
+                            vulnerabilities, 'redirect chain', test_url, param_name,
+                            payload, 'URL Parameter (Redirect Chain)',
+                            response_full.status_code, final_url, 'High',
+                            f'Open redirect via {param_name} parameter (redirect chain)',
+                            'redirect chain vulnerability'
+                        )
                 else:
                     self.log(f"Filtered false positive redirect chain: {test_url} -> {final_url}", 'VERBOSE', Fore.YELLOW)
         
@@ -307,203 +528,158 @@ class Scanner:
             js_redirects = parse_response_for_redirects(response.text, payload)
             for js_redirect in js_redirects:
                 if self.is_legitimate_external_redirect(base_url, js_redirect, payload):
-                    # Check if it's an evil.com redirect and needs verification
-                    is_evil_com = 'evil.com' in js_redirect.lower()
-                    verified = True  # Default to true for non-evil.com redirects
-                    
-                    # Verify evil.com redirects if enabled
-                    if is_evil_com and self.verify_evil_com:
-                        self.log(f"Verifying evil.com JS/Meta redirect: {js_redirect}", 'VERBOSE', Fore.YELLOW)
-                        verified = verify_evil_com_redirect(js_redirect)
-                        if not verified:
-                            self.log(f"Failed to verify evil.com JS/Meta redirect: {js_redirect}", 'VERBOSE', Fore.RED)
-                    
-                    # Only report as vulnerability if verified or verification is disabled
-                    if verified or not self.verify_evil_com:
-                        vulnerability = {
-                            'url': test_url,
-                            'parameter': param_name,
-                            'payload': payload,
-                            'method': 'JavaScript/Meta Redirect',
-                            'status_code': response.status_code,
-                            'location_header': js_redirect,
-                            'severity': 'Medium',
-                            'description': f'Open redirect via {param_name} parameter (JavaScript/Meta)',
-                            'verified': verified
-                        }
-                        vulnerabilities.append(vulnerability)
-                        verification_status = "(verified)" if verified else "(unverified)"
-                        self.log(f"Found JavaScript/Meta redirect: {test_url} -> {js_redirect} {verification_status}", 'VULN')
-        
+                    self.record_finding(
+                        vulnerabilities, 'JS/Meta redirect', test_url, param_name,
+                        payload, 'JavaScript/Meta Redirect', response.status_code,
+                        js_redirect, 'Medium',
+                        f'Open redirect via {param_name} parameter (JavaScript/Meta)',
+                        'JavaScript/Meta redirect'
+                    )
+
+        if vulnerabilities:
+            self._payload_score[payload] += 1
+
         return vulnerabilities
     
+    def test_url_parameter_batch(self, base_url, param_name, payloads, stop_event=None):
+        """Test every payload against one URL parameter as a single burst
+
+        Issuing the probes back-to-back keeps the pooled keep-alive
+        connection hot, so the TCP/TLS setup is amortized across the
+        whole payload list for this (URL, parameter) pair. stop_event,
+        when given, lets the submitting scan abort in-flight bursts for
+        its URL (fast mode) without touching the scanner-wide shutdown.
+        """
+        vulnerabilities = []
+        delay = self.delay
+        fast_mode = self.fast_mode
+
+        for payload in payloads:
+            if self._shutdown or (stop_event is not None and stop_event.is_set()):
+                break
+
+            vulnerabilities.extend(self.test_url_parameter(base_url, param_name, payload))
+
+            # Apply delay if configured
+            if delay > 0 and not self._shutdown:
+                time.sleep(delay)
+
+            # Fast mode: stop after first vulnerability found
+            if fast_mode and vulnerabilities:
+                break
+
+        return vulnerabilities
+
     def test_header_injection(self, url, payload):
         """Test header-based injection"""
         vulnerabilities = []
         
         if not self.test_headers:
             return vulnerabilities
-        
-        # Headers to test (expanded for real-world scenarios including 2025 findings)
-        test_headers = [
-            'X-Redirect-To',
-            'X-Forward-To', 
-            'X-Forwarded-Host',     # Critical: Used in dashboard.omise.co attack
-            'X-Forwarded-For',
-            'X-Real-IP',
-            'Location',
-            'Referer',
-            'Origin',
-            'Host',
-            'X-Original-Host',
-            'X-Host',
-            'Forwarded',
-            'Via',
-            'X-Forwarded-Proto',
-            'X-Forwarded-Port',
-            'X-Custom-Redirect',
-            'X-Return-To',
-            'X-Continue-To',
-            # Additional headers from 2025 research
-            'X-Forwarded-URI',
-            'X-Original-URI',
-            'X-Rewrite-URL',
-            'CF-Connecting-IP',     # Cloudflare specific
-            'True-Client-IP',       # Akamai specific
-            'X-Cluster-Client-IP',  # AWS ALB specific
-            'X-Forwarded-Server',
-            'X-ProxyUser-Ip'
-        ]
-        
-        for header_name in test_headers:
+
+        # Bind the per-iteration attribute lookups once; the loop body
+        # runs for every header name on every payload
+        log = self.log
+        make_request = self.make_request
+        verbose = self.verbose
+
+        for header_name in _HEADER_INJECTION_NAMES:
+            # Header probes repeat whenever URL lists share an endpoint;
+            # reuse the probed-set so each (url, header, payload) combo
+            # costs one request total
+            probe_key = (url, 'header', header_name, payload)
+            if self.already_probed(probe_key):
+                continue
+
             headers = {header_name: payload}
-            
-            self.log(f"Testing header {header_name}: {url}", 'VERBOSE', Fore.BLUE)
-            
-            response = self.make_request(url, headers=headers, allow_redirects=False)
+
+            if verbose:
+                log(f"Testing header {header_name}: {url}", 'VERBOSE', Fore.BLUE)
+
+            response = make_request(url, headers=headers, allow_redirects=False)
             if not response:
+                self.forget_probed(probe_key)
                 continue
             
             # Check if the header value is reflected in response
             location = response.headers.get('Location', '')
             if location and payload in location:
                 if self.is_legitimate_external_redirect(url, location, payload):
-                    # Check if it's an evil.com redirect and needs verification
-                    is_evil_com = 'evil.com' in location.lower()
-                    verified = True  # Default to true for non-evil.com redirects
-                    
-                    # Verify evil.com redirects if enabled
-                    if is_evil_com and self.verify_evil_com:
-                        self.log(f"Verifying evil.com header redirect: {location}", 'VERBOSE', Fore.YELLOW)
-                        verified = verify_evil_com_redirect(location)
-                        if not verified:
-                            self.log(f"Failed to verify evil.com header redirect: {location}", 'VERBOSE', Fore.RED)
-                    
-                    # Only report as vulnerability if verified or verification is disabled
-                    if verified or not self.verify_evil_com:
-                        vulnerability = {
-                            'url': url,
-                            'parameter': header_name,
-                            'payload': payload,
-                            'method': 'Header Injection',
-                            'status_code': response.status_code,
-                            'location_header': location,
-                            'severity': 'High',
-                            'description': f'Open redirect via {header_name} header injection',
-                            'verified': verified
-                        }
-                        vulnerabilities.append(vulnerability)
-                        verification_status = "(verified)" if verified else "(unverified)"
-                        self.log(f"Found header injection vulnerability: {url} ({header_name}) -> {location} {verification_status}", 'VULN')
-        
-        return vulnerabilities
-    
-    def test_advanced_scenarios(self, url, payload):
-        """Test advanced real-world scenarios"""
-        vulnerabilities = []
-        
-        # Test for chain redirects
-        chain_vulns = self.test_chain_redirects(url, payload)
-        vulnerabilities.extend(chain_vulns)
-        
-        # Test for OAuth scenarios
-        oauth_vulns = self.test_oauth_scenarios(url, payload)
-        vulnerabilities.extend(oauth_vulns)
-        
-        # Test for enterprise scenarios
-        enterprise_vulns = self.test_enterprise_scenarios(url, payload)
-        vulnerabilities.extend(enterprise_vulns)
-        
-        return vulnerabilities
-    
-    def test_chain_redirects(self, url, payload):
-        """Test for chain redirect vulnerabilities"""
-        vulnerabilities = []
-        
-        # Look for chain redirect patterns
-        chain_params = ['first', 'second', 'third', 'chain', 'hop', 'intermediate']
-        
-        for param in chain_params:
-            if param in url.lower():
-                # Test the chain redirect
-                test_vuln = self.test_url_parameter(url, param, payload)
-                for vuln in test_vuln:
-                    vuln['method'] = 'Chain Redirect'
-                    vuln['severity'] = 'High'
-                    vulnerabilities.extend([vuln])
-        
+                    self.record_finding(
+                        vulnerabilities, 'header redirect', url, header_name,
+                        payload, 'Header Injection', response.status_code,
+                        location, 'High',
+                        f'Open redirect via {header_name} header injection',
+                        f'header injection vulnerability ({header_name})'
+                    )
+
+        if vulnerabilities:
+            self._payload_score[payload] += 1
+
         return vulnerabilities
     
-    def test_oauth_scenarios(self, url, payload):
-        """Test OAuth-specific vulnerabilities"""
-        vulnerabilities = []
-        
+    def classify_advanced_scenarios(self, url):
+        """Classify a URL for the advanced real-world scenarios
+
+        Runs the chain/OAuth/enterprise indicator checks once and returns
+        a list of (param_name, method_label, severity) tuples, so the
+        per-payload loop doesn't repeat the URL classification.
+        """
+        url_lower = url.lower()
+        scenarios = []
+
+        # Chain redirect patterns
+        for param in _CHAIN_PARAMS:
+            if param in url_lower:
+                scenarios.append((param, 'Chain Redirect', 'High'))
+
         # OAuth endpoints and parameters
-        oauth_indicators = ['oauth', 'authorize', 'redirect_uri', 'client_id', 'response_type']
-        
-        if any(indicator in url.lower() for indicator in oauth_indicators):
-            # Test OAuth redirect_uri parameter specifically
-            oauth_params = ['redirect_uri', 'callback_url', 'return_url', 'state']
-            
-            for param in oauth_params:
-                test_vuln = self.test_url_parameter(url, param, payload)
-                for vuln in test_vuln:
-                    vuln['method'] = 'OAuth Redirect'
-                    vuln['severity'] = 'Critical'  # OAuth vulnerabilities are often critical
-                    vulnerabilities.extend([vuln])
-        
-        return vulnerabilities
-    
-    def test_enterprise_scenarios(self, url, payload):
-        """Test enterprise application scenarios"""
-        vulnerabilities = []
-        
+        if any(indicator in url_lower for indicator in _OAUTH_INDICATORS):
+            # OAuth vulnerabilities are often critical
+            for param in _OAUTH_PARAMS:
+                scenarios.append((param, 'OAuth Redirect', 'Critical'))
+
         # Enterprise application indicators
-        enterprise_indicators = [
-            'grafana', 'jenkins', 'gitlab', 'github', 'jira', 'confluence',
-            'admin', 'dashboard', 'login', 'sso', 'saml', 'ldap',
-            'payment', 'checkout', 'success', 'confirm', 'verify'
-        ]
-        
-        if any(indicator in url.lower() for indicator in enterprise_indicators):
-            # Test enterprise-specific parameters
-            enterprise_params = [
-                'returnTo', 'return_to', 'success_url', 'cancel_url',
-                'confirm_url', 'verify_url', 'next_page', 'continue_to'
-            ]
-            
-            for param in enterprise_params:
-                test_vuln = self.test_url_parameter(url, param, payload)
-                for vuln in test_vuln:
-                    vuln['method'] = 'Enterprise Application'
-                    vuln['severity'] = 'High'
-                    vulnerabilities.extend([vuln])
-        
+        if any(indicator in url_lower for indicator in _ENTERPRISE_INDICATORS):
+            for param in _ENTERPRISE_PARAMS:
+                scenarios.append((param, 'Enterprise Application', 'High'))
+
+        return scenarios
+
+    def test_advanced_scenarios(self, url, payload, scenarios=None):
+        """Test advanced real-world scenarios"""
+        if scenarios is None:
+            scenarios = self.classify_advanced_scenarios(url)
+
+        vulnerabilities = []
+        for param, method_label, severity in scenarios:
+            for vuln in self.test_url_parameter(url, param, payload):
+                vuln['method'] = method_label
+                vuln['severity'] = severity
+                vulnerabilities.append(vuln)
+
         return vulnerabilities
-    
-        
 
-    
+    def prewarm_connection(self, url):
+        """Open a connection to the target origin before the payload storm
+
+        The session keeps the pooled connection alive, so the first real
+        probe skips the TCP and TLS handshake, and urllib3 can resume the
+        TLS session when the pool tops up. Best effort only — failures
+        are left for the real probes to surface.
+        """
+        parsed = urllib.parse.urlsplit(url)
+        if not parsed.scheme or not parsed.netloc:
+            return
+
+        origin = f"{parsed.scheme}://{parsed.netloc}/"
+        try:
+            with self.request_gate:
+                self.session.head(origin, timeout=self.timeout,
+                                  verify=self.verify_ssl, allow_redirects=False)
+        except requests.exceptions.RequestException:
+            pass
+
     def scan_single_url(self, url):
         """Scan a single URL for open redirect vulnerabilities"""
         # Check for shutdown at the beginning
@@ -532,60 +708,137 @@ class Scanner:
             }
         
         vulnerabilities = []
-        
-        # Parse URL to identify existing parameters
-        parsed_url = urllib.parse.urlparse(url)
-        existing_params = urllib.parse.parse_qs(parsed_url.query)
-        
+
+        # Establish the connection once before the payload loop starts
+        self.prewarm_connection(url)
+
+        # Identify existing parameters; only the key names matter here,
+        # so split them out directly instead of having parse_qs
+        # percent-decode every value into throwaway lists
+        query = urllib.parse.urlsplit(url).query
+        existing_params = [kv.split('=', 1)[0] for kv in query.split('&') if kv] if query else []
+
         # Get parameters to test
-        params_to_test = self.payload_manager.get_parameters_to_test(existing_params.keys())
+        params_to_test = self.payload_manager.get_parameters_to_test(existing_params)
         
-        # Get payloads to test
+        # Get payloads to test, most productive first when hit counts
+        # exist; sorted() is stable, so unscored payloads keep their
+        # original order
         payloads = self.payload_manager.get_payloads()
-        
-        # Test each parameter with each payload
+        if self._payload_score:
+            payloads = sorted(payloads, key=self._payload_score.__getitem__, reverse=True)
+
+        # Hoist frequently accessed attributes to locals; the loop below
+        # touches them once per (parameter, payload) pair
+        fast_mode = self.fast_mode
+        delay = self.delay
+        log = self.log
+
+        # Skip parameters that are likely to cause false positives
+        testable_params = []
         for param_name in params_to_test:
-            # Check for shutdown
-            if self._shutdown:
-                break
-                
-            # Skip parameters that are likely to cause false positives
             if self.should_skip_parameter(url, param_name):
-                self.log(f"Skipping parameter with false positive potential: {param_name}", 'VERBOSE', Fore.YELLOW)
+                log(f"Skipping parameter with false positive potential: {param_name}", 'VERBOSE', Fore.YELLOW)
                 continue
-                
-            for payload in payloads:
+            testable_params.append(param_name)
+
+        # Classify the URL for chain/OAuth/enterprise scenarios once.
+        # The probed-set gives each (endpoint, param, payload) combo a
+        # single probe — in the main loop below — so scenario params get
+        # their method/severity labels applied to those findings here
+        # rather than through a second probe that the seen-set would
+        # swallow. Critical wins when a param matches several scenarios.
+        advanced_scenarios = self.classify_advanced_scenarios(url)
+        scenario_overrides = {}
+        for param, method_label, severity in advanced_scenarios:
+            if param not in scenario_overrides or severity == 'Critical':
+                scenario_overrides[param] = (method_label, severity)
+
+        # Test each parameter with the full payload list as one burst.
+        # Without a pacing delay the bursts run in parallel on the
+        # shared long-lived inner pool — a single-URL scan is otherwise
+        # fully serial while the thread budget idles. Total in-flight
+        # requests stay capped by the request gate regardless of how the
+        # bursts are scheduled.
+        inner_pool = self._param_pool
+        if delay == 0 and inner_pool is not None and len(testable_params) > 1 and not self._shutdown:
+            # Per-URL stop flag: cancelling a future only helps before
+            # it starts, so running bursts poll this to stop probing
+            # once this URL's scan is done with them
+            stop_event = threading.Event()
+            future_to_param = {
+                inner_pool.submit(self.test_url_parameter_batch, url, param_name, payloads, stop_event): param_name
+                for param_name in testable_params
+            }
+            try:
+                for future in as_completed(future_to_param):
+                    if self._shutdown:
+                        break
+                    param_vulns = future.result()
+                    override = scenario_overrides.get(future_to_param[future])
+                    if override:
+                        for vuln in param_vulns:
+                            vuln['method'], vuln['severity'] = override
+                    vulnerabilities.extend(self.filter_false_positives(url, param_vulns))
+
+                    # Fast mode: stop after first vulnerability found
+                    if fast_mode and vulnerabilities:
+                        break
+            finally:
+                # Stop in-flight bursts and drop queued ones; the pool
+                # itself is shared across URLs and stays up
+                stop_event.set()
+                for pending in future_to_param:
+                    pending.cancel()
+        else:
+            for param_name in testable_params:
                 # Check for shutdown
                 if self._shutdown:
                     break
-                    
-                # Test URL parameter
-                param_vulns = self.test_url_parameter(url, param_name, payload)
-                
+
+                param_vulns = self.test_url_parameter_batch(url, param_name, payloads)
+
+                override = scenario_overrides.get(param_name)
+                if override:
+                    for vuln in param_vulns:
+                        vuln['method'], vuln['severity'] = override
+
                 # Filter out false positives
                 filtered_vulns = self.filter_false_positives(url, param_vulns)
                 vulnerabilities.extend(filtered_vulns)
-                
+
+                if fast_mode and vulnerabilities:
+                    break
+
+        # Header injection and advanced scenarios don't depend on the
+        # parameter under test, so run them once per payload instead of
+        # repeating them for every parameter. The scenario pass only
+        # issues requests for scenario params the main loop didn't
+        # already probe (e.g. in small mode); overlapping params were
+        # relabeled above.
+        if not (fast_mode and vulnerabilities):
+            for payload in payloads:
+                # Check for shutdown
+                if self._shutdown:
+                    break
+
                 # Test header injection
                 header_vulns = self.test_header_injection(url, payload)
                 filtered_header_vulns = self.filter_false_positives(url, header_vulns)
                 vulnerabilities.extend(filtered_header_vulns)
-                
+
                 # Test advanced real-world scenarios
-                advanced_vulns = self.test_advanced_scenarios(url, payload)
+                advanced_vulns = self.test_advanced_scenarios(url, payload, advanced_scenarios)
                 filtered_advanced_vulns = self.filter_false_positives(url, advanced_vulns)
                 vulnerabilities.extend(filtered_advanced_vulns)
-                
+
                 # Apply delay if configured
-                if self.delay > 0 and not self._shutdown:
-                    time.sleep(self.delay)
-                
+                if delay > 0 and not self._shutdown:
+                    time.sleep(delay)
+
                 # Fast mode: stop after first vulnerability found
-                if self.fast_mode and vulnerabilities:
+                if fast_mode and vulnerabilities:
                     break
-            
-            if self.fast_mode and vulnerabilities:
-                break
         
         result = {
             'url': url,
@@ -630,8 +883,7 @@ class Scanner:
         
         # Skip queue systems with target parameter pointing to same domain
         if self.ignore_queue_systems:
-            parsed_url = urllib.parse.urlparse(url)
-            domain = parsed_url.netloc.lower()
+            domain = get_domain_from_url(url) or ''
             
             if ('queue.' in domain or '/queue/' in url) and 'target=' in url:
                 # Extract the domain from the target parameter
@@ -666,8 +918,7 @@ class Scanner:
             
         # Skip 'target' parameter in queue systems
         if self.ignore_queue_systems:
-            parsed_url = urllib.parse.urlparse(url)
-            domain = parsed_url.netloc.lower()
+            domain = get_domain_from_url(url) or ''
             
             if ('queue.' in domain or '/queue/' in url) and param_name == 'target':
                 return True
@@ -676,6 +927,12 @@ class Scanner:
         
     def filter_false_positives(self, url, vulnerabilities):
         """Filter out false positives from detected vulnerabilities"""
+        # The overwhelming majority of probes yield no vulnerabilities;
+        # skip the per-finding work (and the list copy) outright when
+        # there is nothing to filter or filtering is disabled
+        if not vulnerabilities or not self.reduce_false_positives:
+            return vulnerabilities
+
         filtered_vulns = []
         
         for vuln in vulnerabilities:
@@ -699,13 +956,10 @@ class Scanner:
         if not redirect_url:
             return False
             
-        # Parse the URLs
-        original_parsed = urllib.parse.urlparse(url)
-        redirect_parsed = urllib.parse.urlparse(redirect_url)
-        
-        # Get domains
-        original_domain = original_parsed.netloc.lower()
-        redirect_domain = redirect_parsed.netloc.lower()
+        # Get domains through the memoized helper (parsed once per
+        # distinct URL, not once per finding)
+        original_domain = get_domain_from_url(url) or ''
+        redirect_domain = get_domain_from_url(redirect_url) or ''
         
         # Remove www. prefix for comparison
         original_domain = original_domain.replace('www.', '')
@@ -766,49 +1020,64 @@ class Scanner:
     def scan_urls(self, urls):
         """Scan multiple URLs using thread pool"""
         results = []
-        
+
+        # Reuse one long-lived executor per scanner instead of creating a
+        # fresh pool (and fresh worker threads) for every scan_urls call
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads)
+        executor = self._executor
+
         try:
-            with ThreadPoolExecutor(max_workers=self.threads) as executor:
-                # Submit all URLs for scanning
-                future_to_url = {}
-                for url in urls:
+            # Submit all URLs for scanning
+            future_to_url = {}
+            for url in urls:
+                if self._shutdown:
+                    break
+                future = executor.submit(self.scan_single_url, url)
+                future_to_url[future] = url
+
+            # Progress is reported in chunks rather than per completion,
+            # so large URL lists don't serialize workers on the output
+            # lock just to print a counter
+            total = len(future_to_url)
+            progress_step = max(1, total // 20)
+            completed = 0
+
+            # Process completed scans
+            try:
+                for future in as_completed(future_to_url):
                     if self._shutdown:
+                        # Cancel all remaining futures immediately
+                        for remaining_future in future_to_url:
+                            if not remaining_future.done():
+                                remaining_future.cancel()
                         break
-                    future = executor.submit(self.scan_single_url, url)
-                    future_to_url[future] = url
-                
-                # Process completed scans
-                try:
-                    for future in as_completed(future_to_url):
-                        if self._shutdown:
-                            # Cancel all remaining futures immediately
-                            for remaining_future in future_to_url:
-                                if not remaining_future.done():
-                                    remaining_future.cancel()
-                            break
-                            
-                        url = future_to_url[future]
-                        try:
-                            result = future.result(timeout=0.1)  # Quick timeout for immediate shutdown
-                            results.append(result)
-                        except Exception as e:
-                            if not self._shutdown:  # Only log if not shutting down
-                                self.log(f"Error scanning {url}: {str(e)}", 'ERROR')
-                                # Add error result
-                                results.append({
-                                    'url': url,
-                                    'vulnerabilities': [],
-                                    'error': str(e),
-                                    'timestamp': time.time()
-                                })
-                except KeyboardInterrupt:
-                    self._shutdown = True
-                    # Cancel all pending futures immediately
-                    for future in future_to_url:
-                        future.cancel()
-                    raise
+
+                    url = future_to_url[future]
+                    try:
+                        result = future.result(timeout=0.1)  # Quick timeout for immediate shutdown
+                        results.append(result)
+                        completed += 1
+                        if completed % progress_step == 0 and total > 1:
+                            self.log(f"Progress: {completed}/{total} URLs scanned", 'INFO', Fore.CYAN)
+                    except Exception as e:
+                        if not self._shutdown:  # Only log if not shutting down
+                            self.log(f"Error scanning {url}: {str(e)}", 'ERROR')
+                            # Add error result
+                            results.append({
+                                'url': url,
+                                'vulnerabilities': [],
+                                'error': str(e),
+                                'timestamp': time.time()
+                            })
+            except KeyboardInterrupt:
+                self._shutdown = True
+                # Cancel all pending futures immediately
+                for future in future_to_url:
+                    future.cancel()
+                raise
         except KeyboardInterrupt:
             self._shutdown = True
             raise
-            
+
         return results
@@ -2,11 +2,22 @@
 External tool integration for OpenX scanner
 """
 
+import re
 import subprocess
 import os
 import tempfile
 from .utils import validate_url, is_valid_domain
 
+# Keywords that suggest a redirect parameter; the compiled alternation
+# scans each candidate URL in one C-level pass instead of looping the
+# list per URL in Python
+_REDIRECT_KEYWORDS = (
+    'redirect', 'url', 'return', 'next', 'goto', 'target',
+    'destination', 'forward', 'location', 'site', 'callback',
+    'success', 'continue', 'r', 'u', 'link', 'path', 'ref'
+)
+_REDIRECT_KEYWORD_RE = re.compile('|'.join(re.escape(k) for k in _REDIRECT_KEYWORDS))
+
 class ExternalTools:
     """Integration with external URL gathering tools"""
     
@@ -132,12 +143,6 @@ class ExternalTools:
     
     def filter_potential_redirect_urls(self, urls):
         """Filter URLs that potentially contain redirect parameters"""
-        redirect_keywords = [
-            'redirect', 'url', 'return', 'next', 'goto', 'target',
-            'destination', 'forward', 'location', 'site', 'callback',
-            'success', 'continue', 'r', 'u', 'link', 'path', 'ref'
-        ]
-        
         potential_urls = []
         
         for url in urls:
@@ -147,12 +152,12 @@ class ExternalTools:
             # Look for redirect keywords in query parameters
             if '?' in url:
                 query_part = url.split('?', 1)[1]
-                if any(keyword in query_part for keyword in redirect_keywords):
+                if _REDIRECT_KEYWORD_RE.search(query_part):
                     potential_urls.append(url)
                     continue
             
             # Look for redirect keywords in path
-            if any(keyword in url_lower for keyword in redirect_keywords):
+            if _REDIRECT_KEYWORD_RE.search(url_lower):
                 potential_urls.append(url)
                 continue
             
@@ -69,20 +69,27 @@ class PayloadManager:
             'url', 'redirect', 'return', 'next', 'goto', 'target',
             'redirect_uri', 'callback', 'r', 'u'
         ]
-    
+
+        # Deduped once up front; get_parameters_to_test runs per URL and
+        # the base list never changes after construction
+        base = self.common_redirect_params if small_mode else self.all_redirect_params
+        self._base_params = tuple(dict.fromkeys(base))
+
     def get_parameters_to_test(self, existing_params=None):
-        """Get list of parameters to test"""
-        existing_params = existing_params or []
-        
-        if self.small_mode:
-            base_params = self.common_redirect_params
-        else:
-            base_params = self.all_redirect_params
-        
-        # Always test existing parameters
-        params_to_test = list(set(base_params + list(existing_params)))
-        
-        return params_to_test
+        """Get list of parameters to test
+
+        Parameters already present in the URL lead the list — they are
+        by far the most likely to be vulnerable, so testing them first
+        lets fast mode exit early. dict.fromkeys dedupes while keeping
+        that order deterministic (a plain set() scrambled it).
+        """
+        if not existing_params:
+            return list(self._base_params)
+
+        # Always test existing parameters, and test them first
+        existing = list(dict.fromkeys(existing_params))
+        existing_set = set(existing)
+        return existing + [p for p in self._base_params if p not in existing_set]
     
     def get_basic_payloads(self):
         """Get basic open redirect payloads"""
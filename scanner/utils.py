@@ -5,45 +5,112 @@ Utility functions for OpenX scanner
 import re
 import urllib.parse
 import socket
-from urllib.parse import urlparse
+import threading
+import time
+import requests
+from functools import lru_cache
+from urllib.parse import urlparse, urlsplit
+
+# In-process DNS cache to avoid a resolver round-trip on every request
+# when hundreds of payloads are aimed at the same host
+_DNS_CACHE = {}
+_DNS_CACHE_LOCK = threading.Lock()
+_DNS_CACHE_TTL = 300  # seconds
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache_installed = False
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """Resolve host/port through a TTL-bounded in-process cache"""
+    key = (host, port, family, type, proto, flags)
+    now = time.time()
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(key)
+        if cached and cached[1] > now:
+            return cached[0]
+    result = _original_getaddrinfo(host, port, family, type, proto, flags)
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[key] = (result, now + _DNS_CACHE_TTL)
+    return result
+
+def install_dns_cache():
+    """Install the caching resolver in front of socket.getaddrinfo (idempotent)"""
+    global _dns_cache_installed
+    if not _dns_cache_installed:
+        socket.getaddrinfo = _cached_getaddrinfo
+        _dns_cache_installed = True
 
 def validate_url(url):
     """Validate if a URL is properly formatted"""
     try:
-        result = urlparse(url)
+        # urlsplit skips the ;params handling urlparse adds on top,
+        # and only scheme/netloc are needed here. It only raises
+        # ValueError (malformed IPv6 brackets and the like); anything
+        # broader would mask real bugs while costing the same.
+        result = urlsplit(url)
         return all([result.scheme, result.netloc])
-    except Exception:
+    except ValueError:
         return False
 
-def load_urls_from_file(filepath):
-    """Load URLs from a file, one per line"""
-    urls = []
+# Fast-path acceptor for the common http(s) line shape: scheme, a
+# bracket-free host, optional rest. Anything it rejects (IPv6 hosts,
+# other schemes) falls back to the full urlsplit validation, so it can
+# only ever accept a subset of what validate_url accepts.
+_URL_LINE_RE = re.compile(r'^https?://[^\s/?#\[\]]+(?:[/?#][^\s\[\]]*)?$')
+
+def iter_urls_from_file(filepath):
+    """Yield validated URLs from a file lazily, one per line
+
+    Keeps memory flat on large input files; callers that feed a worker
+    pool can start submitting before the whole file is read.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'r', encoding='utf-8', buffering=1 << 16) as f:
             for line in f:
                 url = line.strip()
-                if url and not url.startswith('#') and validate_url(url):
-                    urls.append(url)
+                if url and not url.startswith('#') and \
+                        (_URL_LINE_RE.match(url) or validate_url(url)):
+                    yield url
     except FileNotFoundError:
         raise FileNotFoundError(f"URL file not found: {filepath}")
     except Exception as e:
         raise Exception(f"Error reading URL file: {str(e)}")
-    
-    return urls
 
+def load_urls_from_file(filepath):
+    """Load URLs from a file, one per line"""
+    return list(iter_urls_from_file(filepath))
+
+# Scheme-default port suffixes; a host carrying its default port is
+# the same host, so comparisons shouldn't see the ':80'/':443'
+_DEFAULT_PORT_SUFFIXES = {'http': ':80', 'https': ':443'}
+
+@lru_cache(maxsize=4096)
 def get_domain_from_url(url):
-    """Extract domain from URL"""
+    """Extract domain from URL
+
+    Memoized: the same original URL and payload strings are parsed over
+    and over across the payload loops, so repeats skip urlparse entirely.
+    Default ports are stripped so http://host:80 compares equal to host.
+    """
     try:
-        parsed = urlparse(url)
-        return parsed.netloc.lower()
-    except Exception:
+        parsed = urlsplit(url)
+        netloc = parsed.netloc.lower()
+        default = _DEFAULT_PORT_SUFFIXES.get(parsed.scheme)
+        if default and netloc.endswith(default):
+            netloc = netloc[:-len(default)]
+        return netloc
+    except ValueError:
         return None
 
 def is_external_redirect(original_url, redirect_url):
     """Check if a redirect is to an external domain"""
     if not redirect_url:
         return False
-        
+
+    # Identical strings are trivially the same place; one C-level
+    # compare beats two domain extractions
+    if redirect_url == original_url:
+        return False
+
     # Handle relative URLs
     if redirect_url.startswith('/'):
         return False
@@ -138,23 +205,49 @@ def is_external_redirect(original_url, redirect_url):
     # Default: domains are different, so it's an external redirect
     return True
 
+# Precompiled patterns for redirect extraction; compiling once at import
+# time keeps pattern-compile cost out of the per-response hot path
+_URL_PATTERNS = [
+    re.compile(r'https?://[^\s<>"\'\)]+'),
+    re.compile(r'//[^\s<>"\'\)]+'),
+    re.compile(r'[a-zA-Z][a-zA-Z0-9+.-]*://[^\s<>"\'\)]+'),
+]
+
+# The individual JS redirect patterns are fused into one alternation so
+# the response body is scanned in a single pass instead of once per
+# pattern; exactly one capture group is set per match
+_JS_REDIRECT_EXPRESSIONS = [
+    r'window\.location\s*=\s*[\'"]([^\'"]+)[\'"]',
+    r'window\.location\.href\s*=\s*[\'"]([^\'"]+)[\'"]',
+    r'window\.location\.replace\s*\(\s*[\'"]([^\'"]+)[\'"]',
+    r'location\.href\s*=\s*[\'"]([^\'"]+)[\'"]',
+    r'location\s*=\s*[\'"]([^\'"]+)[\'"]',
+    r'document\.location\s*=\s*[\'"]([^\'"]+)[\'"]',
+]
+
+_JS_REDIRECT_RE = re.compile(
+    '|'.join(f'(?:{expr})' for expr in _JS_REDIRECT_EXPRESSIONS),
+    re.IGNORECASE
+)
+
+_META_REFRESH_PATTERN = re.compile(
+    r'<meta[^>]+http-equiv=[\'"]refresh[\'"][^>]+content=[\'"][^;]*;\s*url=([^\'"]+)[\'"]',
+    re.IGNORECASE
+)
+
+_FORM_ACTION_PATTERN = re.compile(r'<form[^>]+action=[\'"]([^\'"]+)[\'"]', re.IGNORECASE)
+
 def extract_redirect_url(response_text, payload):
     """Extract redirect URLs from response text"""
     redirect_urls = []
-    
+
     # Look for the payload in the response
     if payload not in response_text:
         return redirect_urls
-    
+
     # Find URLs that contain our payload
-    url_patterns = [
-        r'https?://[^\s<>"\'\)]+',
-        r'//[^\s<>"\'\)]+',
-        r'[a-zA-Z][a-zA-Z0-9+.-]*://[^\s<>"\'\)]+'
-    ]
-    
-    for pattern in url_patterns:
-        matches = re.findall(pattern, response_text)
+    for pattern in _URL_PATTERNS:
+        matches = pattern.findall(response_text)
         for match in matches:
             if payload in match:
                 redirect_urls.append(match)
@@ -167,33 +260,21 @@ def parse_response_for_redirects(response_text, payload):
     
     if not response_text or payload not in response_text:
         return redirects
-    
-    # JavaScript window.location redirects
-    js_patterns = [
-        r'window\.location\s*=\s*[\'"]([^\'"]+)[\'"]',
-        r'window\.location\.href\s*=\s*[\'"]([^\'"]+)[\'"]',
-        r'window\.location\.replace\s*\(\s*[\'"]([^\'"]+)[\'"]',
-        r'location\.href\s*=\s*[\'"]([^\'"]+)[\'"]',
-        r'location\s*=\s*[\'"]([^\'"]+)[\'"]',
-        r'document\.location\s*=\s*[\'"]([^\'"]+)[\'"]',
-    ]
-    
-    for pattern in js_patterns:
-        matches = re.findall(pattern, response_text, re.IGNORECASE)
-        for match in matches:
-            if payload in match:
-                redirects.append(match)
-    
+
+    # JavaScript window.location redirects (single pass over the body)
+    for m in _JS_REDIRECT_RE.finditer(response_text):
+        match = next(g for g in m.groups() if g)
+        if payload in match:
+            redirects.append(match)
+
     # Meta refresh redirects
-    meta_pattern = r'<meta[^>]+http-equiv=[\'"]refresh[\'"][^>]+content=[\'"][^;]*;\s*url=([^\'"]+)[\'"]'
-    meta_matches = re.findall(meta_pattern, response_text, re.IGNORECASE)
+    meta_matches = _META_REFRESH_PATTERN.findall(response_text)
     for match in meta_matches:
         if payload in match:
             redirects.append(match)
-    
+
     # HTML form action redirects (if payload is in action)
-    form_pattern = r'<form[^>]+action=[\'"]([^\'"]+)[\'"]'
-    form_matches = re.findall(form_pattern, response_text, re.IGNORECASE)
+    form_matches = _FORM_ACTION_PATTERN.findall(response_text)
     for match in form_matches:
         if payload in match:
             redirects.append(match)
@@ -230,26 +311,44 @@ def is_valid_domain(domain):
     except Exception:
         return False
 
+# Precompiled, case-insensitive scheme test; startswith missed
+# mixed-case schemes like HTTP:// and would have double-prefixed them
+_HTTP_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+
 def normalize_url(url):
     """Normalize URL for consistent processing"""
     if not url:
         return url
-    
+
     # Add protocol if missing
     if url.startswith('//'):
         url = 'http:' + url
-    elif not url.startswith(('http://', 'https://')):
+    elif not _HTTP_SCHEME_RE.match(url):
         if '.' in url and not url.startswith('./'):
             url = 'http://' + url
-    
+
     return url
 
+def format_duration(seconds):
+    """Format a duration in seconds as a short human-readable string"""
+    seconds = int(seconds)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes}m {seconds}s"
+    if minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+@lru_cache(maxsize=256)
 def verify_evil_com_redirect(url):
-    """Verify that a redirect to evil.com is legitimate by checking for specific markers"""
+    """Verify that a redirect to evil.com is legitimate by checking for specific markers
+
+    Cached per URL: the same Location shows up across many parameters
+    and payloads, and each verification is a full HTTP fetch — by far
+    the most expensive repeated step on the validation path.
+    """
     try:
-        import requests
-        from urllib.parse import urlparse
-        
         # Parse the URL to check if it's pointing to evil.com or a subdomain
         parsed_url = urlparse(url)
         domain = parsed_url.netloc.lower()